@@ -9,16 +9,54 @@ os.environ.setdefault('FLASK_ENV', 'development')
 
 import pandas as pd
 import numpy as np
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
-import seaborn as sns
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import io
 import base64
+import hashlib
+import importlib.util
+import itertools
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
 import json
 
-from flask import Flask, render_template, request, jsonify, redirect, url_for, flash, send_file
+from flask import Flask, Response, render_template, request, redirect, url_for, flash, send_file
+from jinja2 import FileSystemBytecodeCache
+from werkzeug.utils import secure_filename
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from cachetools import TTLCache
+except ImportError:
+    class TTLCache:
+        """Sustituto mínimo de cachetools.TTLCache: tamaño máximo y expiración por entrada"""
+        
+        def __init__(self, maxsize, ttl):
+            self.maxsize = maxsize
+            self.ttl = ttl
+            self._datos = OrderedDict()
+        
+        def __setitem__(self, clave, valor):
+            self._datos.pop(clave, None)
+            self._datos[clave] = (time.monotonic() + self.ttl, valor)
+            if len(self._datos) > self.maxsize:
+                self._datos.popitem(last=False)
+        
+        def get(self, clave, default=None):
+            entrada = self._datos.get(clave)
+            if entrada is None:
+                return default
+            expira, valor = entrada
+            if expira < time.monotonic():
+                self._datos.pop(clave, None)
+                return default
+            return valor
 
 # Importar configuración
 from config import config
@@ -31,13 +69,60 @@ print(f"🔧 Ejecutando en modo: {env}")
 
 app.config.from_object(config[env])
 
+# Caché de bytecode de Jinja compartida entre recargas y workers; se omite si
+# el directorio no se puede escribir (por ejemplo, una instalación de solo lectura)
+try:
+    os.makedirs(app.config['JINJA_CACHE_DIR'], exist_ok=True)
+    if os.access(app.config['JINJA_CACHE_DIR'], os.W_OK):
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache(app.config['JINJA_CACHE_DIR'])
+except OSError:
+    pass
+
+def precompilar_plantillas():
+    """Compilar todas las plantillas al arrancar para que la primera petición no pague el parseo"""
+    for nombre_plantilla in app.jinja_env.list_templates():
+        app.jinja_env.get_template(nombre_plantilla)
+
 # Importar utils después de configurar Flask
 from utils.congruenciales import *
 from utils.estadisticos import *
 from utils.validaciones import *
 
-# Variables globales para almacenar resultados
-resultados_simulacion = {}
+# Variables globales para almacenar resultados (acotadas en cantidad y antigüedad)
+resultados_simulacion = TTLCache(maxsize=128, ttl=3600)
+_resultados_lock = threading.Lock()
+
+# Figura de gráficos congruenciales reutilizada por cada hilo del servidor
+_figuras = threading.local()
+
+# Extensiones aceptadas en cada formulario de subida
+_EXTENSIONES_DATOS = frozenset({'.csv', '.xlsx', '.txt'})
+_EXTENSIONES_TRABAJOS = frozenset({'.py', '.ipynb', '.pdf', '.docx', '.zip'})
+
+# Contador que desambigua archivos subidos en el mismo instante
+_contador_uploads = itertools.count()
+
+# Tamaño de bloque al copiar archivos subidos a disco
+_BLOQUE_COPIA_UPLOAD = 4 * 1024 * 1024
+
+# Generador aleatorio compartido para los datos de exportación
+_rng = np.random.default_rng()
+
+# Formatos de exportación de resultados: extensión y tipo MIME
+_FORMATOS_EXPORTACION = {
+    'csv': ('csv', 'text/csv'),
+    'feather': ('feather', 'application/vnd.apache.arrow.file'),
+    'parquet': ('parquet', 'application/octet-stream')
+}
+
+# Análisis de archivos ya procesados, indexados por hash del contenido
+_analisis_por_hash = OrderedDict()
+_analisis_lock = threading.Lock()
+_MAX_ANALISIS_CACHEADOS = 32
+
+# Motores de lectura nativos opcionales (ver Config.FAST_IO)
+_PYARROW_DISPONIBLE = importlib.util.find_spec('pyarrow') is not None
+_CALAMINE_DISPONIBLE = importlib.util.find_spec('python_calamine') is not None
 
 @app.route('/')
 def index():
@@ -75,10 +160,14 @@ def metodos_congruenciales():
                     numeros = congruencial_cuadratico(semilla, a, b, c_const, m, cantidad)
                 
                 # Generar gráficos
-                fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
+                fig, (ax1, ax2) = obtener_figura_congruencial()
+                ax1.cla()
+                ax2.cla()
                 
                 # Histograma
-                ax1.hist(numeros, bins=20, alpha=0.7, color='skyblue', edgecolor='black')
+                frecuencias, bordes = np.histogram(numeros, bins=20)
+                ax1.bar(bordes[:-1], frecuencias, width=np.diff(bordes), align='edge',
+                        alpha=0.7, color='skyblue', edgecolor='black')
                 ax1.set_title('Distribución de Números Generados')
                 ax1.set_xlabel('Valor')
                 ax1.set_ylabel('Frecuencia')
@@ -90,14 +179,10 @@ def metodos_congruenciales():
                 ax2.set_ylabel('Valor')
                 ax2.grid(True, alpha=0.3)
                 
-                plt.tight_layout()
-                
                 # Convertir gráfico a base64
                 img = io.BytesIO()
-                plt.savefig(img, format='png', dpi=150)
-                img.seek(0)
-                plot_url = base64.b64encode(img.getvalue()).decode()
-                plt.close()
+                fig.canvas.print_png(img)
+                plot_url = base64.b64encode(img.getbuffer()).decode('ascii')
                 
                 # Estadísticas descriptivas
                 stats = {
@@ -109,7 +194,7 @@ def metodos_congruenciales():
                 }
                 
                 return render_template('metodos_congruenciales.html',
-                                    numeros=numeros,
+                                    numeros=numeros.tolist(),
                                     plot_url=plot_url,
                                     stats=stats,
                                     metodo=metodo)
@@ -119,30 +204,26 @@ def metodos_congruenciales():
                 archivo = request.files['subir_archivo']
                 if archivo and archivo.filename != '':
                     # Validar extensión
-                    if not archivo.filename.endswith(('.csv', '.xlsx', '.txt')):
+                    if os.path.splitext(archivo.filename)[1].lower() not in _EXTENSIONES_DATOS:
                         flash('Formato de archivo no válido. Use CSV, Excel o TXT.', 'error')
                         return redirect(url_for('metodos_congruenciales'))
                     
                     # Guardar archivo
-                    filename = f"congruencial_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{archivo.filename}"
+                    filename = nombre_archivo_subido('congruencial', archivo.filename)
                     filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-                    archivo.save(filepath)
+                    digest = guardar_archivo_subido(archivo, filepath)
                     
                     # Procesar según extensión
                     try:
-                        if filename.endswith('.csv'):
-                            datos = pd.read_csv(filepath)
-                        elif filename.endswith('.xlsx'):
-                            datos = pd.read_excel(filepath)
-                        else:
-                            datos = pd.read_csv(filepath, delimiter='\t')
+                        datos = leer_archivo_datos(filepath)
                         
                         # Analizar datos del archivo
-                        analisis_archivo = analizar_datos_archivo(datos)
+                        analisis_archivo = analizar_archivo_cacheado(digest, filepath, datos,
+                                                                     deep=request.args.get('deep') == '1')
                         
                         flash('Archivo procesado correctamente', 'success')
                         return render_template('metodos_congruenciales.html',
-                                            datos_archivo=datos.head(10).to_dict('records'),
+                                            datos_archivo=registros_json(datos.head(10)),
                                             analisis_archivo=analisis_archivo,
                                             filename=filename)
                     
@@ -170,19 +251,15 @@ def procesar_archivo_congruencial():
         filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
         
         # Cargar y procesar datos
-        if filename.endswith('.csv'):
-            datos = pd.read_csv(filepath)
-        elif filename.endswith('.xlsx'):
-            datos = pd.read_excel(filepath)
-        else:
-            datos = pd.read_csv(filepath, delimiter='\t')
+        datos = leer_archivo_datos(filepath)
         
         # Aquí implementarías la lógica específica para procesar
         # los datos del archivo con el método congruencial seleccionado
         resultados = procesar_datos_congruencial(datos, metodo)
         
         # Guardar resultados globalmente
-        resultados_simulacion['congruencial'] = resultados
+        with _resultados_lock:
+            resultados_simulacion['congruencial'] = resultados
         
         return render_template('resultados.html',
                              resultados=resultados,
@@ -226,15 +303,14 @@ def subir_trabajo():
             
             if archivo and archivo.filename != '':
                 # Validar tipo de archivo
-                extensiones_permitidas = ['.py', '.ipynb', '.pdf', '.docx', '.zip']
-                if not any(archivo.filename.endswith(ext) for ext in extensiones_permitidas):
+                if os.path.splitext(archivo.filename)[1].lower() not in _EXTENSIONES_TRABAJOS:
                     flash('Tipo de archivo no permitido', 'error')
                     return redirect(url_for('subir_trabajo'))
                 
                 # Guardar archivo
-                filename = f"trabajo_{tipo_trabajo}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{archivo.filename}"
+                filename = nombre_archivo_subido(f'trabajo_{tipo_trabajo}', archivo.filename)
                 filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-                archivo.save(filepath)
+                guardar_archivo_subido(archivo, filepath)
                 
                 # Registrar en base de datos (aquí podrías usar SQLite)
                 registro = {
@@ -253,24 +329,41 @@ def subir_trabajo():
     
     return render_template('upload.html')
 
-@app.route('/descargar-plantilla/<tipo>')
-def descargar_plantilla(tipo):
-    """Descargar plantillas para trabajos"""
-    plantillas = {
-        'congruencial': 'plantilla_congruencial.py',
-        'montecarlo': 'plantilla_monte_carlo.py',
-        'transformada': 'plantilla_transformada.py'
-    }
+# Plantillas descargables para trabajos
+_PLANTILLA_CONGRUENCIAL = '''# Plantilla para Métodos Congruenciales
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # Sin Numba las funciones se ejecutan como Python normal
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda funcion: funcion
+
+INT64_MAX = 2**63 - 1
+
+@njit(cache=True)
+def _congruencial_lineal_kernel(semilla, a, c, m, n):
+    """Ciclo del generador lineal (compilado con Numba, aritmética int64)"""
+    numeros = np.empty(n)
+    x = semilla
     
-    if tipo in plantillas:
-        # Crear contenido de plantilla básica
-        if tipo == 'congruencial':
-            contenido = '''# Plantilla para Métodos Congruenciales
+    for i in range(n):
+        x = (a * x + c) % m
+        numeros[i] = x / m  # Normalizar a [0,1)
+    
+    return numeros
 
 def congruencial_lineal(semilla, a, c, m, n):
     """
     Generador congruencial lineal
     
+    Usa el ciclo compilado solo si a*x + c no puede desbordar int64;
+    en otro caso usa la versión Python, exacta para cualquier entero.
+    
     Args:
         semilla (int): Valor inicial
         a (int): Multiplicador
@@ -279,16 +372,14 @@ def congruencial_lineal(semilla, a, c, m, n):
         n (int): Cantidad de números
     
     Returns:
-        list: Números pseudoaleatorios
+        np.ndarray: Números pseudoaleatorios
     """
-    numeros = []
-    x = semilla
+    cota = max(abs(semilla), abs(m))
+    if abs(a) * cota + abs(c) <= INT64_MAX:
+        return _congruencial_lineal_kernel(semilla, a, c, m, n)
     
-    for _ in range(n):
-        x = (a * x + c) % m
-        numeros.append(x / m)  # Normalizar a [0,1)
-    
-    return numeros
+    ciclo_python = getattr(_congruencial_lineal_kernel, 'py_func', _congruencial_lineal_kernel)
+    return ciclo_python(semilla, a, c, m, n)
 
 # Ejemplo de uso
 if __name__ == "__main__":
@@ -302,15 +393,51 @@ if __name__ == "__main__":
     numeros = congruencial_lineal(semilla, a, c, m, n)
     print("Números generados:", numeros)
 '''
-        elif tipo == 'montecarlo':
-            contenido = '''# Plantilla para Método Monte Carlo
 
-import random
+_PLANTILLA_MONTE_CARLO = '''# Plantilla para Método Monte Carlo
+
 import math
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_DISPONIBLE = True
+except ImportError:
+    NUMBA_DISPONIBLE = False
+    
+    # Sin Numba las funciones se ejecutan como Python normal
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda funcion: funcion
+
+def monte_carlo_pi(n_puntos, semilla=None):
+    """
+    Estimación de π usando Monte Carlo (vectorizada con NumPy)
+    
+    Args:
+        n_puntos (int): Número de puntos a generar
+        semilla (int): Semilla del generador (opcional)
+    
+    Returns:
+        float: Estimación de π
+    """
+    rng = np.random.default_rng(semilla)
+    puntos = rng.uniform(-1, 1, size=(n_puntos, 2))
+    x = puntos[:, 0]
+    y = puntos[:, 1]
+    
+    dentro_circulo = np.count_nonzero(x * x + y * y <= 1)
+    
+    return 4 * dentro_circulo / n_puntos
 
-def monte_carlo_pi(n_puntos):
+@njit(cache=True)
+def monte_carlo_pi_numba(n_puntos):
     """
-    Estimación de π usando Monte Carlo
+    Estimación de π usando Monte Carlo (ciclo compilado con Numba)
+    
+    No guarda los puntos en memoria, así que sirve para n_puntos
+    demasiado grandes para la versión vectorizada.
     
     Args:
         n_puntos (int): Número de puntos a generar
@@ -321,10 +448,10 @@ def monte_carlo_pi(n_puntos):
     dentro_circulo = 0
     
     for _ in range(n_puntos):
-        x = random.uniform(-1, 1)
-        y = random.uniform(-1, 1)
+        x = np.random.uniform(-1.0, 1.0)
+        y = np.random.uniform(-1.0, 1.0)
         
-        if x**2 + y**2 <= 1:
+        if x * x + y * y <= 1.0:
             dentro_circulo += 1
     
     return 4 * dentro_circulo / n_puntos
@@ -335,30 +462,46 @@ if __name__ == "__main__":
     pi_estimado = monte_carlo_pi(n_puntos)
     print(f"π estimado con {n_puntos} puntos: {pi_estimado}")
     print(f"Error: {abs(math.pi - pi_estimado)}")
+    
+    # Sin Numba el ciclo punto por punto tardaría minutos con 10**8 puntos
+    if NUMBA_DISPONIBLE:
+        n_grande = 10**8
+        pi_estimado = monte_carlo_pi_numba(n_grande)
+        print(f"π estimado con {n_grande} puntos: {pi_estimado}")
+        print(f"Error: {abs(math.pi - pi_estimado)}")
 '''
-        else:  # transformada
-            contenido = '''# Plantilla para Transformada Inversa
 
-import math
-import random
+_PLANTILLA_TRANSFORMADA = '''# Plantilla para Transformada Inversa
+
+import numpy as np
 
+try:
+    from numba import njit
+except ImportError:
+    # Sin Numba las funciones se ejecutan como Python normal
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda funcion: funcion
+
+@njit(cache=True)
 def transformada_inversa_exponencial(lambda_param, n):
     """
     Generar variables exponenciales usando transformada inversa
+    (compilado con Numba)
     
     Args:
         lambda_param (float): Parámetro de tasa
         n (int): Número de variables a generar
     
     Returns:
-        list: Variables exponenciales
+        np.ndarray: Variables exponenciales
     """
-    variables = []
+    variables = np.empty(n)
     
-    for _ in range(n):
-        u = random.random()
-        x = -math.log(1 - u) / lambda_param
-        variables.append(x)
+    for i in range(n):
+        u = np.random.random()
+        variables[i] = -np.log(1.0 - u) / lambda_param
     
     return variables
 
@@ -369,14 +512,20 @@ if __name__ == "__main__":
     variables = transformada_inversa_exponencial(lambda_param, n)
     print("Variables exponenciales:", variables)
 '''
-        
-        # Crear respuesta de descarga
-        output = io.BytesIO()
-        output.write(contenido.encode('utf-8'))
-        output.seek(0)
-        
-        return send_file(output,
-                       mimetype='text/python',
+
+# Contenido codificado una sola vez al importar el módulo
+_PLANTILLAS = {
+    'congruencial': _PLANTILLA_CONGRUENCIAL.encode('utf-8'),
+    'montecarlo': _PLANTILLA_MONTE_CARLO.encode('utf-8'),
+    'transformada': _PLANTILLA_TRANSFORMADA.encode('utf-8')
+}
+
+@app.route('/descargar-plantilla/<tipo>')
+def descargar_plantilla(tipo):
+    """Descargar plantillas para trabajos"""
+    if tipo in _PLANTILLAS:
+        return send_file(io.BytesIO(_PLANTILLAS[tipo]),
+                       mimetype='text/x-python',
                        as_attachment=True,
                        download_name=f'plantilla_{tipo}.py')
     
@@ -407,44 +556,56 @@ def api_generar_numeros():
                 parametros.get('n', 10)
             )
         else:
-            return jsonify({'error': 'Método no válido'}), 400
+            return respuesta_json({'error': 'Método no válido'}, 400)
         
-        return jsonify({
+        return respuesta_json({
             'numeros': numeros,
             'estadisticas': {
-                'media': float(np.mean(numeros)),
-                'desviacion': float(np.std(numeros)),
-                'min': float(np.min(numeros)),
-                'max': float(np.max(numeros))
+                'media': numeros.mean(),
+                'desviacion': numeros.std(),
+                'min': numeros.min(),
+                'max': numeros.max()
             }
         })
     
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return respuesta_json({'error': str(e)}, 500)
 
 @app.route('/exportar-resultados/<tipo>')
 def exportar_resultados(tipo):
-    """Exportar resultados a CSV"""
+    """Exportar resultados a CSV, Feather o Parquet (parámetro ?fmt=)"""
     try:
-        if tipo in resultados_simulacion:
-            resultados = resultados_simulacion[tipo]
-            
+        formato = request.args.get('fmt', 'csv')
+        if formato not in _FORMATOS_EXPORTACION:
+            flash(f'Formato de exportación no válido: {formato}', 'error')
+            return redirect(url_for('index'))
+        
+        with _resultados_lock:
+            resultados = resultados_simulacion.get(tipo)
+        
+        if resultados is not None:
             # Crear DataFrame con datos de ejemplo
-            datos_ejemplo = [
-                {'iteracion': i, 'valor': np.random.random(), 'metodo': tipo}
-                for i in range(100)
-            ]
-            df = pd.DataFrame(datos_ejemplo)
+            df = pd.DataFrame({
+                'iteracion': np.arange(100),
+                'valor': _rng.random(100),
+                'metodo': tipo
+            })
             
             # Generar archivo
             output = io.BytesIO()
-            df.to_csv(output, index=False)
+            if formato == 'feather':
+                df.to_feather(output)
+            elif formato == 'parquet':
+                df.to_parquet(output, engine='pyarrow', compression='zstd')
+            else:
+                df.to_csv(output, index=False, lineterminator='\n')
             output.seek(0)
             
-            filename = f"resultados_{tipo}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+            extension, mimetype = _FORMATOS_EXPORTACION[formato]
+            filename = f"resultados_{tipo}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{extension}"
             
             return send_file(output,
-                           mimetype='text/csv',
+                           mimetype=mimetype,
                            as_attachment=True,
                            download_name=filename)
         else:
@@ -489,7 +650,105 @@ def acerca():
     return render_template('acerca.html')
 
 # Funciones auxiliares
-def analizar_datos_archivo(datos):
+def _a_json_nativo(obj):
+    """Convertir arreglos y escalares de NumPy para json.dumps"""
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    raise TypeError(f'Objeto de tipo {type(obj).__name__} no serializable a JSON')
+
+def respuesta_json(payload, status=200):
+    """Crear respuesta JSON serializando con orjson (con soporte NumPy) si está disponible"""
+    if orjson is not None:
+        cuerpo = orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+    else:
+        cuerpo = json.dumps(payload, default=_a_json_nativo)
+    return Response(cuerpo, status=status, mimetype='application/json')
+
+def nombre_archivo_subido(prefijo, nombre_original):
+    """Generar un nombre único y seguro para guardar un archivo subido"""
+    return secure_filename(f"{prefijo}_{time.time_ns():x}_{next(_contador_uploads)}_{nombre_original}")
+
+def guardar_archivo_subido(archivo, filepath):
+    """Copiar el archivo subido a disco en bloques grandes y devolver su hash BLAKE2b"""
+    # El directorio de uploads se crea en la primera subida, no al importar
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    
+    h = hashlib.blake2b(digest_size=16)
+    with open(filepath, 'wb', buffering=0) as destino:
+        for bloque in iter(lambda: archivo.stream.read(_BLOQUE_COPIA_UPLOAD), b''):
+            h.update(bloque)
+            destino.write(bloque)
+    return h.hexdigest()
+
+def obtener_figura_congruencial():
+    """Obtener la figura del hilo actual, creándola solo en el primer uso"""
+    if not hasattr(_figuras, 'fig'):
+        dpi = app.config['VISUALIZATION_CONFIG']['dpi_graficos']
+        fig = Figure(figsize=(12, 5), dpi=dpi, constrained_layout=True)
+        FigureCanvasAgg(fig)
+        _figuras.fig = fig
+        _figuras.ejes = fig.subplots(1, 2)
+    return _figuras.fig, _figuras.ejes
+
+def leer_archivo_datos(filepath):
+    """Leer archivo de datos subido según su extensión"""
+    rapido = app.config.get('FAST_IO', False)
+    opciones_csv = {}
+    if rapido and _PYARROW_DISPONIBLE:
+        opciones_csv = {'engine': 'pyarrow', 'dtype_backend': 'pyarrow'}
+    
+    extension = os.path.splitext(filepath)[1].lower()
+    if extension == '.csv':
+        return pd.read_csv(filepath, **opciones_csv)
+    elif extension == '.xlsx':
+        if rapido and _CALAMINE_DISPONIBLE:
+            return pd.read_excel(filepath, engine='calamine')
+        return pd.read_excel(filepath)
+    else:
+        return pd.read_csv(filepath, delimiter='\t', **opciones_csv)
+
+def registros_json(df):
+    """Convertir un DataFrame en lista de registros con el serializador JSON de pandas"""
+    return json.loads(df.to_json(orient='records', date_format='iso'))
+
+def analizar_archivo_cacheado(digest, filepath, datos, deep=False):
+    """Analizar datos del archivo reutilizando el resultado si el contenido (digest) ya se analizó"""
+    # El mismo contenido se interpreta distinto según la extensión y FAST_IO
+    extension = os.path.splitext(filepath)[1].lower()
+    clave = (digest, extension, app.config.get('FAST_IO', False), deep)
+    
+    with _analisis_lock:
+        analisis = _analisis_por_hash.get(clave)
+        if analisis is not None:
+            _analisis_por_hash.move_to_end(clave)
+            return analisis
+    
+    analisis = analizar_datos_archivo(datos, deep=deep)
+    
+    with _analisis_lock:
+        _analisis_por_hash[clave] = analisis
+        if len(_analisis_por_hash) > _MAX_ANALISIS_CACHEADOS:
+            _analisis_por_hash.popitem(last=False)
+    
+    return analisis
+
+def estimar_memoria(df, deep=False):
+    """Estimar la memoria del DataFrame en bytes sin recorrer cada objeto, salvo con deep=True"""
+    if deep:
+        return df.memory_usage(deep=True).sum()
+    
+    # Punteros y buffers más el largo de las cadenas en columnas object
+    memoria = df.memory_usage(deep=False).sum()
+    for columna in df.select_dtypes(include='object').columns:
+        try:
+            memoria += df[columna].str.len().sum()
+        except AttributeError:
+            # La columna no contiene cadenas
+            pass
+    
+    return memoria
+
+def analizar_datos_archivo(datos, deep=False):
     """Analizar datos del archivo subido"""
     if isinstance(datos, pd.DataFrame):
         df = datos
@@ -501,13 +760,13 @@ def analizar_datos_archivo(datos):
         'columnas': list(df.columns),
         'tipos_datos': df.dtypes.astype(str).to_dict(),
         'valores_faltantes': df.isnull().sum().to_dict(),
-        'memoria_usada': f"{df.memory_usage(deep=True).sum() / 1024:.2f} KB"
+        'memoria_usada': f"{estimar_memoria(df, deep) / 1024:.2f} KB"
     }
     
-    # Estadísticas para columnas numéricas
-    columnas_numericas = df.select_dtypes(include=[np.number]).columns
-    if not columnas_numericas.empty:
-        analisis['estadisticas'] = df[columnas_numericas].describe().to_dict()
+    # Estadísticas para columnas numéricas (sin los cuantiles de describe())
+    numericas = df.select_dtypes(include=[np.number])
+    if not numericas.columns.empty:
+        analisis['estadisticas'] = numericas.agg(['mean', 'std', 'min', 'max']).to_dict()
     
     return analisis
 
@@ -515,7 +774,7 @@ def procesar_datos_congruencial(datos, metodo):
     """Procesar datos para métodos congruenciales"""
     # Implementar lógica específica según el método y datos
     resultados = {
-        'datos_originales': datos.head().to_dict('records') if isinstance(datos, pd.DataFrame) else datos[:5],
+        'datos_originales': registros_json(datos.head()) if isinstance(datos, pd.DataFrame) else datos[:5],
         'metodo_aplicado': metodo,
         'resultados': 'Procesamiento completado exitosamente',
         'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
@@ -535,13 +794,27 @@ def pagina_no_encontrada(error):
 def error_servidor(error):
     return render_template('500.html'), 500
 
+# Aplicación ASGI:
+#   uvicorn app:asgi_app --workers 1 --loop uvloop
+# Un solo worker: resultados_simulacion y el caché de análisis viven en la
+# memoria de cada proceso, así que con varios workers la exportación puede
+# caer en un proceso que no tiene los resultados del archivo procesado.
+# La concurrencia la da el WSGIMiddleware de a2wsgi, que reparte las
+# peticiones entre ASGI_HILOS hilos; el trabajo bloqueante (matplotlib,
+# pandas) no detiene el event loop. No se usa WsgiToAsgi de asgiref porque
+# ejecuta todas las peticiones en un único hilo compartido.
+try:
+    from a2wsgi import WSGIMiddleware
+    asgi_app = WSGIMiddleware(app, workers=app.config['ASGI_HILOS'])
+except ImportError as e:
+    asgi_app = None
+    app.logger.warning(f"asgi_app no disponible (instala a2wsgi para usar uvicorn): {e}")
+
 if __name__ == '__main__':
     print("🚀 Iniciando Dashboard de Estadística Computacional...")
     print(f"📊 Modo: {env}")
     print(f"🔧 Debug: {app.config['DEBUG']}")
     print(f"🌐 URL: http://localhost:5000")
     
-    # Crear directorio de uploads si no existe
-    os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
-    
+    precompilar_plantillas()
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
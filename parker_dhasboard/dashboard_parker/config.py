@@ -21,12 +21,21 @@ class Config:
         'zip', 'rar', '7z'
     }
     
+    # Leer CSV con el motor de pyarrow y XLSX con calamine cuando estén instalados
+    FAST_IO = True
+    
+    # Hilos del pool que atiende las peticiones al servir con uvicorn (asgi_app)
+    ASGI_HILOS = 8
+    
     # Configuración de la base de datos (SQLite por defecto)
     BASEDIR = os.path.abspath(os.path.dirname(__file__))
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or \
         'sqlite:///' + os.path.join(BASEDIR, 'dashboard_estadistica.db')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     
+    # Directorio para la caché de bytecode de las plantillas Jinja
+    JINJA_CACHE_DIR = os.path.join(BASEDIR, '.jinja_cache')
+    
     # Configuración de sesión
     PERMANENT_SESSION_LIFETIME = timedelta(days=1)
     
@@ -77,7 +86,7 @@ class Config:
         'color_advertencia': '#f39c12',
         'estilo_graficos': 'seaborn',
         'tamanio_fuente': 12,
-        'dpi_graficos': 150,
+        'dpi_graficos': 100,
         'formato_imagen': 'png'
     }
     
@@ -125,6 +134,9 @@ class ProductionConfig(Config):
     DEBUG = False
     TESTING = False
     
+    # Las plantillas no cambian en producción: no revisar si se modificaron
+    TEMPLATES_AUTO_RELOAD = False
+    
     # Clave secreta más segura en producción
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'clave_temporal_desarrollo_12345'
     
@@ -159,10 +171,6 @@ def get_upload_path(filename=''):
     """Obtener ruta completa para uploads"""
     return os.path.join(Config.UPLOAD_FOLDER, filename)
 
-def create_upload_folder():
-    """Crear directorio de uploads si no existe"""
-    os.makedirs(Config.UPLOAD_FOLDER, exist_ok=True)
-
 def get_algoritmo_config(nombre_algoritmo):
     """Obtener configuración específica de un algoritmo"""
     return Config.ALGORITMOS_CONFIG.get(nombre_algoritmo, {})
@@ -171,6 +179,3 @@ def get_parametros_default(nombre_algoritmo):
     """Obtener parámetros por defecto de un algoritmo"""
     algo_config = get_algoritmo_config(nombre_algoritmo)
     return algo_config.get('parametros_default', {})
-
-# Inicializar directorio de uploads al importar el módulo
-create_upload_folder()
\ No newline at end of file
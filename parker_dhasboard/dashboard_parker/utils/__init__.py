@@ -5,6 +5,7 @@ from .validaciones import *
 
 __all__ = [
     'congruencial_lineal',
+    'congruencial_lineal_vec',
     'congruencial_multiplicativo', 
     'congruencial_cuadratico',
     'calcular_estadisticos',
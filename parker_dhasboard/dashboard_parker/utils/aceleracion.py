@@ -0,0 +1,20 @@
+"""
+Compilación JIT opcional con Numba
+
+Si Numba no está instalado, `njit` deja las funciones intactas, `prange`
+es el `range` de Python y los kernels se ejecutan como Python normal con
+los mismos resultados.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_DISPONIBLE = True
+except ImportError:
+    NUMBA_DISPONIBLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Sustituto de numba.njit que devuelve la función sin compilar"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda funcion: funcion
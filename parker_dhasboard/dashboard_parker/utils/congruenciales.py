@@ -1,7 +1,208 @@
+import math
+import statistics
+import threading
 import numpy as np
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 
-def congruencial_lineal(semilla: int, a: int, c: int, m: int, n: int) -> List[float]:
+from .aceleracion import njit, prange, NUMBA_DISPONIBLE
+from .estadisticos import _momentos_un_paso, _cuantiles, _cuantiles_ordenados
+
+try:
+    from scipy import stats as _scipy_stats
+    _SCIPY_DISPONIBLE = True
+except ImportError:
+    _SCIPY_DISPONIBLE = False
+
+_INT64_MAX = 2**63 - 1
+
+# Mayor módulo potencia de dos cuya máscara y valor caben en int64
+_MODULO_POT2_MAX = 2**62
+
+# Por debajo de este tamaño el costo fijo de crear arrays de NumPy domina
+_UMBRAL_PYTHON_PURO = 32
+
+# La capa de hilos "workqueue" de Numba (la única sin TBB ni OpenMP) aborta el
+# proceso si dos hilos lanzan kernels paralelos a la vez: se serializan las llamadas
+_lotes_lock = threading.Lock()
+
+@njit(cache=True)
+def _lcg_kernel(semilla, a, c, m, numeros):
+    """Llenar `numeros` con la recurrencia X = (a*X + c) mod m normalizada a [0,1)"""
+    inv_m = 1.0 / m
+    x = semilla
+    
+    for i in range(numeros.shape[0]):
+        x = (a * x + c) % m
+        numeros[i] = x * inv_m
+
+@njit(cache=True)
+def _cuadratico_kernel(semilla, a, b, c, m, numeros):
+    """Llenar `numeros` con la recurrencia X = (a*X² + b*X + c) mod m normalizada a [0,1)"""
+    inv_m = 1.0 / m
+    x = semilla
+    
+    for i in range(numeros.shape[0]):
+        x = (a * x * x + b * x + c) % m
+        numeros[i] = x * inv_m
+
+@njit(cache=True)
+def _lcg_pot2_kernel(semilla, a, c, mascara, numeros):
+    """
+    Recurrencia lineal con m = mascara + 1 potencia de dos: el módulo es un
+    AND con la máscara y el desborde de int64 no altera los bits que quedan
+    """
+    inv_m = 1.0 / (mascara + 1)
+    x = semilla
+    
+    for i in range(numeros.shape[0]):
+        x = (a * x + c) & mascara
+        numeros[i] = x * inv_m
+
+@njit(cache=True)
+def _cuadratico_pot2_kernel(semilla, a, b, c, mascara, numeros):
+    """Recurrencia cuadrática con m = mascara + 1 potencia de dos, módulo por AND"""
+    inv_m = 1.0 / (mascara + 1)
+    x = semilla
+    
+    for i in range(numeros.shape[0]):
+        x = (a * x * x + b * x + c) & mascara
+        numeros[i] = x * inv_m
+
+@njit(cache=True, parallel=True)
+def _lcg_lotes_kernel(semillas, a, c, m, lotes):
+    """
+    Llenar cada fila de `lotes` con la recurrencia lineal desde su propia
+    semilla; los lotes son independientes y se reparten entre hilos
+    """
+    inv_m = 1.0 / m
+    
+    for k in prange(lotes.shape[0]):
+        x = semillas[k]
+        for i in range(lotes.shape[1]):
+            x = (a * x + c) % m
+            lotes[k, i] = x * inv_m
+
+@njit(cache=True)
+def _lcg_carriles_kernel(estados, a_salto, c_salto, m, numeros):
+    """
+    Llenar `numeros` entrelazando las subsecuencias de `estados`: cada
+    carril guarda un estado y avanza con el salto de tantos pasos como carriles
+    """
+    carriles = estados.shape[0]
+    inv_m = 1.0 / m
+    bloques = numeros.shape[0] // carriles
+    
+    for i in range(bloques):
+        base = i * carriles
+        for j in range(carriles):
+            numeros[base + j] = estados[j] * inv_m
+            estados[j] = (a_salto * estados[j] + c_salto) % m
+    
+    # Cola que no completa un bloque
+    base = bloques * carriles
+    for j in range(numeros.shape[0] - base):
+        numeros[base + j] = estados[j] * inv_m
+
+@njit(cache=True)
+def _lcg_carriles_pot2_kernel(estados, a_salto, c_salto, mascara, numeros):
+    """Igual que _lcg_carriles_kernel con m = mascara + 1 potencia de dos, módulo por AND"""
+    carriles = estados.shape[0]
+    inv_m = 1.0 / (mascara + 1)
+    bloques = numeros.shape[0] // carriles
+    
+    for i in range(bloques):
+        base = i * carriles
+        for j in range(carriles):
+            numeros[base + j] = estados[j] * inv_m
+            estados[j] = (a_salto * estados[j] + c_salto) & mascara
+    
+    # Cola que no completa un bloque
+    base = bloques * carriles
+    for j in range(numeros.shape[0] - base):
+        numeros[base + j] = estados[j] * inv_m
+
+def _kernel_para(kernel, cabe_en_int64: bool):
+    """
+    Elegir la versión compilada del kernel solo si la recurrencia no puede
+    desbordar int64; en otro caso usar la función Python original, que
+    trabaja con enteros de precisión arbitraria
+    """
+    if cabe_en_int64:
+        return kernel
+    return getattr(kernel, 'py_func', kernel)
+
+def _lineal_cabe_en_int64(semilla: int, a: int, c: int, m: int) -> bool:
+    cota = max(abs(semilla), abs(m))
+    return abs(a) * cota + abs(c) <= _INT64_MAX
+
+def _cuadratico_cabe_en_int64(semilla: int, a: int, b: int, c: int, m: int) -> bool:
+    cota = max(abs(semilla), abs(m))
+    return abs(a) * cota * cota + abs(b) * cota + abs(c) <= _INT64_MAX
+
+def _admite_mascara(m, *valores) -> bool:
+    """
+    Los kernels con máscara requieren enteros que quepan en int64 y un
+    módulo potencia de dos no mayor que 2^62
+    """
+    if not all(isinstance(v, (int, np.integer)) for v in (m, *valores)):
+        return False
+    if m <= 0 or m > _MODULO_POT2_MAX or m & (m - 1) != 0:
+        return False
+    return all(abs(v) <= _INT64_MAX for v in valores)
+
+def _salto_afin(a: int, c: int, m: int, k: int) -> Tuple[int, int]:
+    """
+    Coeficientes (A, C) del salto de k pasos de la recurrencia lineal,
+    es decir X[i+k] = (A * X[i] + C) mod m
+    """
+    A, C = 1, 0
+    for _ in range(k):
+        A = (a * A) % m
+        C = (a * C + c) % m
+    return A, C
+
+def _admite_saltos(semilla: int, a: int, c: int, m: int) -> bool:
+    """
+    La versión por saltos necesita parámetros enteros y que A*X + C no
+    desborde 64 bits (con m potencia de dos el desborde de uint64 es inocuo)
+    """
+    if not all(isinstance(v, (int, np.integer)) for v in (semilla, a, c, m)) or m <= 0:
+        return False
+    if m & (m - 1) == 0:
+        return m <= 2**63
+    return (m - 1) * m <= _INT64_MAX
+
+def _lcg_por_saltos(semilla: int, a: int, c: int, m: int, n: int) -> np.ndarray:
+    """
+    Recurrencia lineal vectorizada con NumPy para cuando Numba no está
+    disponible: se calcula en serie un primer bloque de √n valores y luego
+    cada fila del bloque se obtiene de la anterior con un solo salto afín
+    """
+    if n <= 0:
+        return np.empty(0, dtype=np.float64)
+    
+    bloque = max(1, math.isqrt(n))
+    filas = -(-n // bloque)
+    potencia_de_dos = m & (m - 1) == 0
+    estados = np.empty((filas, bloque), dtype=np.uint64 if potencia_de_dos else np.int64)
+    
+    x = semilla
+    for j in range(bloque):
+        x = (a * x + c) % m
+        estados[0, j] = x
+    
+    A, C = _salto_afin(a, c, m, bloque)
+    A, C = estados.dtype.type(A), estados.dtype.type(C)
+    for i in range(1, filas):
+        if potencia_de_dos:
+            # Módulo 2^64 implícito del desborde y luego máscara de m
+            estados[i] = (A * estados[i - 1] + C) & estados.dtype.type(m - 1)
+        else:
+            estados[i] = (A * estados[i - 1] + C) % m
+    
+    return estados.ravel()[:n] / m
+
+def congruencial_lineal(semilla: int, a: int, c: int, m: int, n: int) -> np.ndarray:
     """
     Generador congruencial lineal
     
@@ -13,18 +214,67 @@ def congruencial_lineal(semilla: int, a: int, c: int, m: int, n: int) -> List[fl
         n (int): Cantidad de números a generar
     
     Returns:
-        List[float]: Lista de números pseudoaleatorios en [0,1)
+        np.ndarray: Números pseudoaleatorios en [0,1)
     """
-    numeros = []
-    x = semilla
+    if not NUMBA_DISPONIBLE and _admite_saltos(semilla, a, c, m):
+        return _lcg_por_saltos(semilla, a, c, m, n)
+    
+    numeros = np.empty(n, dtype=np.float64)
+    if _admite_mascara(m, semilla, a, c):
+        _lcg_pot2_kernel(semilla, a, c, m - 1, numeros)
+        return numeros
+    
+    kernel = _kernel_para(_lcg_kernel, _lineal_cabe_en_int64(semilla, a, c, m))
+    kernel(semilla, a, c, m, numeros)
+    return numeros
+
+def congruencial_lineal_vec(semilla: int, a: int, c: int, m: int, n: int, carriles: int = 4) -> np.ndarray:
+    """
+    Generador congruencial lineal por subsecuencias paralelas
+    
+    Produce la misma secuencia que congruencial_lineal, pero avanza
+    `carriles` estados desfasados a la vez con el salto X[i+W] = (A*X[i] + C) mod m,
+    lo que rompe la dependencia serial y permite vectorizar el ciclo.
+    
+    Args:
+        semilla (int): Valor inicial X₀
+        a (int): Multiplicador
+        c (int): Incremento
+        m (int): Módulo
+        n (int): Cantidad de números a generar
+        carriles (int): Número de subsecuencias que avanzan a la vez
+    
+    Returns:
+        np.ndarray: Números pseudoaleatorios en [0,1)
+    
+    Raises:
+        ValueError: Si carriles es menor que 1
+    """
+    if carriles < 1:
+        raise ValueError(f"El número de carriles debe ser al menos 1: {carriles}")
+    
+    # Con m potencia de dos el desborde de int64 es inocuo y el módulo es un AND
+    potencia_de_dos = _admite_mascara(m, semilla, a, c)
+    
+    # Si no, el salto multiplica dos valores menores que m: requiere (m-1)*m en int64
+    if not NUMBA_DISPONIBLE or not (potencia_de_dos or _admite_saltos(semilla, a, c, m) and m <= _INT64_MAX):
+        return congruencial_lineal(semilla, a, c, m, n)
     
-    for _ in range(n):
+    estados = np.empty(carriles, dtype=np.int64)
+    x = semilla
+    for j in range(carriles):
         x = (a * x + c) % m
-        numeros.append(x / m)  # Normalizar a [0,1)
+        estados[j] = x
     
+    a_salto, c_salto = _salto_afin(a, c, m, carriles)
+    numeros = np.empty(n, dtype=np.float64)
+    if potencia_de_dos:
+        _lcg_carriles_pot2_kernel(estados, a_salto, c_salto, m - 1, numeros)
+    else:
+        _lcg_carriles_kernel(estados, a_salto, c_salto, m, numeros)
     return numeros
 
-def congruencial_multiplicativo(semilla: int, a: int, m: int, n: int) -> List[float]:
+def congruencial_multiplicativo(semilla: int, a: int, m: int, n: int) -> np.ndarray:
     """
     Generador congruencial multiplicativo
     
@@ -35,18 +285,21 @@ def congruencial_multiplicativo(semilla: int, a: int, m: int, n: int) -> List[fl
         n (int): Cantidad de números a generar
     
     Returns:
-        List[float]: Lista de números pseudoaleatorios en [0,1)
+        np.ndarray: Números pseudoaleatorios en [0,1)
     """
-    numeros = []
-    x = semilla
+    if not NUMBA_DISPONIBLE and _admite_saltos(semilla, a, 0, m):
+        return _lcg_por_saltos(semilla, a, 0, m, n)
     
-    for _ in range(n):
-        x = (a * x) % m
-        numeros.append(x / m)
+    numeros = np.empty(n, dtype=np.float64)
+    if _admite_mascara(m, semilla, a):
+        _lcg_pot2_kernel(semilla, a, 0, m - 1, numeros)
+        return numeros
     
+    kernel = _kernel_para(_lcg_kernel, _lineal_cabe_en_int64(semilla, a, 0, m))
+    kernel(semilla, a, 0, m, numeros)
     return numeros
 
-def congruencial_cuadratico(semilla: int, a: int, b: int, c: int, m: int, n: int) -> List[float]:
+def congruencial_cuadratico(semilla: int, a: int, b: int, c: int, m: int, n: int) -> np.ndarray:
     """
     Generador congruencial cuadrático
     
@@ -59,18 +312,18 @@ def congruencial_cuadratico(semilla: int, a: int, b: int, c: int, m: int, n: int
         n (int): Cantidad de números a generar
     
     Returns:
-        List[float]: Lista de números pseudoaleatorios en [0,1)
+        np.ndarray: Números pseudoaleatorios en [0,1)
     """
-    numeros = []
-    x = semilla
-    
-    for _ in range(n):
-        x = (a * x**2 + b * x + c) % m
-        numeros.append(x / m)
+    numeros = np.empty(n, dtype=np.float64)
+    if _admite_mascara(m, semilla, a, b, c):
+        _cuadratico_pot2_kernel(semilla, a, b, c, m - 1, numeros)
+        return numeros
     
+    kernel = _kernel_para(_cuadratico_kernel, _cuadratico_cabe_en_int64(semilla, a, b, c, m))
+    kernel(semilla, a, b, c, m, numeros)
     return numeros
 
-def mixed_congruential(semilla: int, a: int, c: int, m: int, n: int) -> List[float]:
+def mixed_congruential(semilla: int, a: int, c: int, m: int, n: int) -> np.ndarray:
     """
     Generador congruencial mixto (combinación lineal y multiplicativo)
     
@@ -82,11 +335,11 @@ def mixed_congruential(semilla: int, a: int, c: int, m: int, n: int) -> List[flo
         n (int): Cantidad de números a generar
     
     Returns:
-        List[float]: Lista de números pseudoaleatorios en [0,1)
+        np.ndarray: Números pseudoaleatorios en [0,1)
     """
     return congruencial_lineal(semilla, a, c, m, n)
 
-def lehmer_generator(semilla: int, a: int, m: int, n: int) -> List[float]:
+def lehmer_generator(semilla: int, a: int, m: int, n: int) -> np.ndarray:
     """
     Generador de Lehmer (variante del congruencial multiplicativo)
     
@@ -97,10 +350,38 @@ def lehmer_generator(semilla: int, a: int, m: int, n: int) -> List[float]:
         n (int): Cantidad de números a generar
     
     Returns:
-        List[float]: Lista de números pseudoaleatorios en [0,1)
+        np.ndarray: Números pseudoaleatorios en [0,1)
     """
     return congruencial_multiplicativo(semilla, a, m, n)
 
+def _generar_lotes_en_paralelo(tipo: str, parametros: Dict[str, Any], lotes: np.ndarray) -> bool:
+    """
+    Llenar la matriz de lotes con el kernel paralelo (semilla + i en el lote i)
+    si el generador es lineal o multiplicativo y la recurrencia cabe en int64
+    
+    Returns:
+        bool: False si los lotes deben generarse uno por uno
+    """
+    if not NUMBA_DISPONIBLE or tipo not in ('lineal', 'multiplicativo'):
+        return False
+    
+    semilla = parametros.get('semilla')
+    a = parametros.get('a')
+    c = parametros.get('c') if tipo == 'lineal' else 0
+    m = parametros.get('m')
+    
+    if not all(isinstance(v, (int, np.integer)) for v in (semilla, a, c, m)) or m <= 0:
+        return False
+    
+    ultima = semilla + lotes.shape[0] - 1
+    if not (_lineal_cabe_en_int64(semilla, a, c, m) and _lineal_cabe_en_int64(ultima, a, c, m)):
+        return False
+    
+    semillas = np.arange(semilla, ultima + 1, dtype=np.int64)
+    with _lotes_lock:
+        _lcg_lotes_kernel(semillas, a, c, m, lotes)
+    return True
+
 def generar_lote_congruencial(tipo: str, parametros: Dict[str, Any], n_lotes: int = 5) -> Dict[str, Any]:
     """
     Generar múltiples lotes de números para análisis
@@ -111,51 +392,56 @@ def generar_lote_congruencial(tipo: str, parametros: Dict[str, Any], n_lotes: in
         n_lotes (int): Número de lotes a generar
     
     Returns:
-        Dict: Resultados con estadísticas por lote
+        Dict: Resultados con estadísticas por lote; 'lotes' es una matriz
+        de forma (n_lotes, n) con un lote por fila
     """
+    n = parametros.get('n', 100)
+    lotes = np.empty((n_lotes, n), dtype=np.float64)
+    
     resultados = {
-        'lotes': [],
+        'lotes': lotes,
         'estadisticas_por_lote': [],
         'estadisticas_globales': {}
     }
     
+    if not _generar_lotes_en_paralelo(tipo, parametros, lotes):
+        for i in range(n_lotes):
+            if tipo == 'lineal':
+                numeros = congruencial_lineal(
+                    parametros.get('semilla') + i,  # Cambiar semilla por lote
+                    parametros.get('a'),
+                    parametros.get('c'),
+                    parametros.get('m'),
+                    n
+                )
+            elif tipo == 'multiplicativo':
+                numeros = congruencial_multiplicativo(
+                    parametros.get('semilla') + i,
+                    parametros.get('a'),
+                    parametros.get('m'),
+                    n
+                )
+            elif tipo == 'cuadratico':
+                numeros = congruencial_cuadratico(
+                    parametros.get('semilla') + i,
+                    parametros.get('a'),
+                    parametros.get('b'),
+                    parametros.get('c_const'),
+                    parametros.get('m'),
+                    n
+                )
+            else:
+                raise ValueError(f"Tipo de generador no válido: {tipo}")
+            
+            lotes[i] = numeros
+    
     for i in range(n_lotes):
-        if tipo == 'lineal':
-            numeros = congruencial_lineal(
-                parametros.get('semilla') + i,  # Cambiar semilla por lote
-                parametros.get('a'),
-                parametros.get('c'),
-                parametros.get('m'),
-                parametros.get('n', 100)
-            )
-        elif tipo == 'multiplicativo':
-            numeros = congruencial_multiplicativo(
-                parametros.get('semilla') + i,
-                parametros.get('a'),
-                parametros.get('m'),
-                parametros.get('n', 100)
-            )
-        elif tipo == 'cuadratico':
-            numeros = congruencial_cuadratico(
-                parametros.get('semilla') + i,
-                parametros.get('a'),
-                parametros.get('b'),
-                parametros.get('c_const'),
-                parametros.get('m'),
-                parametros.get('n', 100)
-            )
-        else:
-            raise ValueError(f"Tipo de generador no válido: {tipo}")
-        
         # Calcular estadísticas del lote
-        stats = calcular_estadisticos_basicos(numeros)
-        
-        resultados['lotes'].append(numeros)
+        stats = calcular_estadisticos_basicos(lotes[i])
         resultados['estadisticas_por_lote'].append(stats)
     
-    # Calcular estadísticas globales
-    todos_numeros = [num for lote in resultados['lotes'] for num in lote]
-    resultados['estadisticas_globales'] = calcular_estadisticos_basicos(todos_numeros)
+    # Calcular estadísticas globales sobre la matriz aplanada (sin copia)
+    resultados['estadisticas_globales'] = calcular_estadisticos_basicos(lotes.ravel())
     
     return resultados
 
@@ -169,21 +455,59 @@ def calcular_estadisticos_basicos(numeros: List[float]) -> Dict[str, float]:
     Returns:
         Dict: Estadísticas calculadas
     """
-    if not numeros:
+    if len(numeros) == 0:
         return {}
     
-    array_np = np.array(numeros)
+    if len(numeros) < _UMBRAL_PYTHON_PURO:
+        return _estadisticos_basicos_python(numeros)
+    
+    array_np = np.ascontiguousarray(numeros, dtype=np.float64)
+    n = array_np.shape[0]
+    
+    # Una pasada para media, varianza y extremos; una selección parcial para los cuartiles
+    referencia, suma, suma_cuadrados, _, _, minimo, maximo = _momentos_un_paso(array_np)
+    desplazamiento = suma / n
+    media = referencia + desplazamiento
+    varianza = max(suma_cuadrados / n - desplazamiento * desplazamiento, 0.0)
+    q1, mediana, q3 = _cuantiles(array_np, (0.25, 0.5, 0.75))
     
     return {
-        'media': float(np.mean(array_np)),
-        'mediana': float(np.median(array_np)),
-        'desviacion_estandar': float(np.std(array_np)),
-        'varianza': float(np.var(array_np)),
-        'minimo': float(np.min(array_np)),
-        'maximo': float(np.max(array_np)),
-        'rango': float(np.max(array_np) - np.min(array_np)),
-        'primer_cuartil': float(np.percentile(array_np, 25)),
-        'tercer_cuartil': float(np.percentile(array_np, 75))
+        'media': media,
+        'mediana': mediana,
+        'desviacion_estandar': math.sqrt(varianza),
+        'varianza': varianza,
+        'minimo': minimo,
+        'maximo': maximo,
+        'rango': maximo - minimo,
+        'primer_cuartil': q1,
+        'tercer_cuartil': q3
+    }
+
+def _estadisticos_basicos_python(numeros: List[float]) -> Dict[str, float]:
+    """
+    Estadísticas básicas con Python puro para pocos números, donde crear
+    arrays y llamar a NumPy cuesta más que el cálculo mismo
+    """
+    valores = numeros.tolist() if isinstance(numeros, np.ndarray) else [float(x) for x in numeros]
+    valores.sort()
+    n = len(valores)
+    
+    media = statistics.fmean(valores)
+    varianza = sum((x - media) ** 2 for x in valores) / n
+    minimo = valores[0]
+    maximo = valores[-1]
+    q1, mediana, q3 = _cuantiles_ordenados(valores, (0.25, 0.5, 0.75))
+    
+    return {
+        'media': media,
+        'mediana': mediana,
+        'desviacion_estandar': math.sqrt(varianza),
+        'varianza': varianza,
+        'minimo': minimo,
+        'maximo': maximo,
+        'rango': maximo - minimo,
+        'primer_cuartil': q1,
+        'tercer_cuartil': q3
     }
 
 def prueba_uniformidad(numeros: List[float], alpha: float = 0.05) -> Dict[str, Any]:
@@ -197,22 +521,30 @@ def prueba_uniformidad(numeros: List[float], alpha: float = 0.05) -> Dict[str, A
     Returns:
         Dict: Resultados de la prueba
     """
-    from scipy import stats
-    
-    try:
-        # Prueba de Kolmogorov-Smirnov
-        d_stat, p_value = stats.kstest(numeros, 'uniform')
-        
-        return {
-            'estadistico_d': d_stat,
-            'p_valor': p_value,
-            'uniforme': p_value > alpha,
-            'nivel_significancia': alpha,
-            'interpretacion': f"Los números son {'uniformemente distribuidos' if p_value > alpha else 'no uniformemente distribuidos'} (p={p_value:.4f})"
-        }
-    except ImportError:
+    if not _SCIPY_DISPONIBLE:
         # Fallback si scipy no está disponible
         return {
             'error': 'Scipy no disponible para pruebas estadísticas',
             'interpretacion': 'No se pudo realizar la prueba de uniformidad'
-        }
\ No newline at end of file
+        }
+    
+    # Prueba de Kolmogorov-Smirnov
+    d_stat, p_value = _scipy_stats.kstest(numeros, 'uniform')
+    
+    return {
+        'estadistico_d': d_stat,
+        'p_valor': p_value,
+        'uniforme': p_value > alpha,
+        'nivel_significancia': alpha,
+        'interpretacion': f"Los números son {'uniformemente distribuidos' if p_value > alpha else 'no uniformemente distribuidos'} (p={p_value:.4f})"
+    }
+
+# Compilar los kernels al importar para que la primera petición no pague la compilación
+if NUMBA_DISPONIBLE:
+    _lcg_kernel(1, 1, 0, 2, np.empty(1))
+    _cuadratico_kernel(1, 1, 1, 1, 2, np.empty(1))
+    _lcg_pot2_kernel(1, 1, 0, 1, np.empty(1))
+    _lcg_lotes_kernel(np.ones(1, dtype=np.int64), 1, 0, 2, np.empty((1, 1)))
+    _cuadratico_pot2_kernel(1, 1, 1, 1, 1, np.empty(1))
+    _lcg_carriles_kernel(np.ones(1, dtype=np.int64), 1, 0, 2, np.empty(1))
+    _lcg_carriles_pot2_kernel(np.ones(1, dtype=np.int64), 1, 0, 1, np.empty(1))
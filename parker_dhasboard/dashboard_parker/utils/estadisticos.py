@@ -1,8 +1,110 @@
 import numpy as np
 import pandas as pd
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Sequence
 import math
 
+from .aceleracion import njit, NUMBA_DISPONIBLE
+
+try:
+    from scipy import stats as _scipy_stats
+    _SCIPY_DISPONIBLE = True
+except ImportError:
+    _SCIPY_DISPONIBLE = False
+
+@njit(cache=True, fastmath={'reassoc', 'contract'})
+def _momentos_un_paso_kernel(datos):
+    """
+    Recorrer los datos una sola vez acumulando mínimo, máximo y las sumas
+    de potencias 1 a 4; las sumas se toman respecto al primer valor para
+    evitar la cancelación al pasar a momentos centrales
+    """
+    referencia = datos[0]
+    suma = 0.0
+    suma_cuadrados = 0.0
+    suma_cubos = 0.0
+    suma_cuartas = 0.0
+    minimo = datos[0]
+    maximo = datos[0]
+    
+    for i in range(datos.shape[0]):
+        valor = datos[i]
+        desvio = valor - referencia
+        cuadrado = desvio * desvio
+        suma += desvio
+        suma_cuadrados += cuadrado
+        suma_cubos += cuadrado * desvio
+        suma_cuartas += cuadrado * cuadrado
+        if valor < minimo:
+            minimo = valor
+        if valor > maximo:
+            maximo = valor
+    
+    return referencia, suma, suma_cuadrados, suma_cubos, suma_cuartas, minimo, maximo
+
+def _momentos_un_paso(datos: np.ndarray) -> Tuple[float, float, float, float, float, float, float]:
+    """
+    Referencia, sumas de potencias 1 a 4 de los desvíos, mínimo y máximo de
+    los datos; sin Numba se usan reducciones de NumPy, más rápidas que el ciclo
+    """
+    if NUMBA_DISPONIBLE:
+        return _momentos_un_paso_kernel(datos)
+    
+    referencia = datos[0]
+    desvios = datos - referencia
+    cuadrados = desvios * desvios
+    return (referencia, desvios.sum(), cuadrados.sum(), np.dot(cuadrados, desvios),
+            np.dot(cuadrados, cuadrados), datos.min(), datos.max())
+
+def _momentos_centrales(n: int, suma: float, suma_cuadrados: float,
+                        suma_cubos: float, suma_cuartas: float) -> Tuple[float, float, float, float]:
+    """
+    Pasar de sumas de potencias de los desvíos a la media de los desvíos y
+    a los momentos centrales de orden 2, 3 y 4
+    """
+    d = suma / n
+    r2 = suma_cuadrados / n
+    r3 = suma_cubos / n
+    r4 = suma_cuartas / n
+    
+    m2 = max(r2 - d * d, 0.0)
+    m3 = r3 - 3 * d * r2 + 2 * d ** 3
+    m4 = r4 - 4 * d * r3 + 6 * d * d * r2 - 3 * d ** 4
+    
+    return d, m2, m3, m4
+
+def _cuantiles(datos: np.ndarray, probabilidades: Sequence[float]) -> List[float]:
+    """
+    Cuantiles con interpolación lineal (igual que np.percentile) usando una
+    sola selección parcial con np.partition en lugar de ordenar por cuantil
+    """
+    n = datos.shape[0]
+    posiciones = [(n - 1) * p for p in probabilidades]
+    indices = sorted({min(int(h) + k, n - 1) for h in posiciones for k in (0, 1)})
+    particion = np.partition(datos, indices)
+    
+    return _cuantiles_ordenados(particion, probabilidades)
+
+def _cuantiles_ordenados(ordenados: Sequence[float], probabilidades: Sequence[float]) -> List[float]:
+    """
+    Cuantiles con interpolación lineal (igual que np.percentile) sobre una
+    secuencia ordenada, o particionada en las posiciones que se consultan
+    """
+    n = len(ordenados)
+    
+    cuantiles = []
+    for p in probabilidades:
+        h = (n - 1) * p
+        i = int(h)
+        fraccion = h - i
+        bajo = ordenados[i]
+        alto = ordenados[min(i + 1, n - 1)]
+        if fraccion >= 0.5:
+            cuantiles.append(alto - (alto - bajo) * (1 - fraccion))
+        else:
+            cuantiles.append(bajo + (alto - bajo) * fraccion)
+    
+    return cuantiles
+
 def calcular_estadisticos(numeros: List[float]) -> Dict[str, float]:
     """
     Calcular estadísticas descriptivas completas
@@ -13,47 +115,47 @@ def calcular_estadisticos(numeros: List[float]) -> Dict[str, float]:
     Returns:
         Dict: Estadísticas calculadas
     """
-    if not numeros:
+    if len(numeros) == 0:
         return {}
     
-    array_np = np.array(numeros)
-    n = len(numeros)
+    array_np = np.ascontiguousarray(numeros, dtype=np.float64)
+    n = array_np.shape[0]
+    
+    # Una sola pasada para los momentos y los extremos
+    referencia, *sumas, minimo, maximo = _momentos_un_paso(array_np)
+    desplazamiento, m2, m3, m4 = _momentos_centrales(n, *sumas)
     
     # Estadísticas básicas
-    media = np.mean(array_np)
-    mediana = np.median(array_np)
-    moda = calcular_moda(numeros)
-    desviacion = np.std(array_np)
-    varianza = np.var(array_np)
+    media = referencia + desplazamiento
+    moda = calcular_moda(array_np)
+    varianza = m2
+    desviacion = math.sqrt(varianza)
     
     # Medidas de posición
-    minimo = np.min(array_np)
-    maximo = np.max(array_np)
     rango = maximo - minimo
-    q1 = np.percentile(array_np, 25)
-    q3 = np.percentile(array_np, 75)
+    q1, mediana, q3 = _cuantiles(array_np, (0.25, 0.5, 0.75))
     iqr = q3 - q1
     
     # Medidas de forma
-    asimetria = calcular_asimetria(array_np)
-    curtosis = calcular_curtosis(array_np)
+    asimetria = m3 / desviacion ** 3 if n >= 3 and desviacion != 0 else 0.0
+    curtosis = m4 / varianza ** 2 - 3 if n >= 4 and desviacion != 0 else 0.0  # Excess kurtosis
     
     return {
         'n': n,
-        'media': float(media),
-        'mediana': float(mediana),
+        'media': media,
+        'mediana': mediana,
         'moda': moda,
-        'desviacion_estandar': float(desviacion),
-        'varianza': float(varianza),
-        'minimo': float(minimo),
-        'maximo': float(maximo),
-        'rango': float(rango),
-        'primer_cuartil': float(q1),
-        'tercer_cuartil': float(q3),
-        'rango_intercuartil': float(iqr),
-        'asimetria': float(asimetria),
-        'curtosis': float(curtosis),
-        'coeficiente_variacion': float(desviacion / media) if media != 0 else 0
+        'desviacion_estandar': desviacion,
+        'varianza': varianza,
+        'minimo': minimo,
+        'maximo': maximo,
+        'rango': rango,
+        'primer_cuartil': q1,
+        'tercer_cuartil': q3,
+        'rango_intercuartil': iqr,
+        'asimetria': asimetria,
+        'curtosis': curtosis,
+        'coeficiente_variacion': desviacion / media if media != 0 else 0
     }
 
 def calcular_moda(numeros: List[float]) -> List[float]:
@@ -66,11 +168,8 @@ def calcular_moda(numeros: List[float]) -> List[float]:
     Returns:
         List[float]: Valores de la moda
     """
-    from collections import Counter
-    contador = Counter(numeros)
-    max_frecuencia = max(contador.values())
-    modas = [num for num, freq in contador.items() if freq == max_frecuencia]
-    return modas
+    valores, frecuencias = np.unique(np.asarray(numeros), return_counts=True)
+    return valores[frecuencias == frecuencias.max()].tolist()
 
 def calcular_asimetria(numeros: np.ndarray) -> float:
     """
@@ -86,14 +185,14 @@ def calcular_asimetria(numeros: np.ndarray) -> float:
     if n < 3:
         return 0.0
     
-    media = np.mean(numeros)
-    desviacion = np.std(numeros)
+    # Momentos centrales a partir de sumas de potencias, sin temporales (x - media)**3
+    _, *sumas, _, _ = _momentos_un_paso(np.ascontiguousarray(numeros, dtype=np.float64))
+    _, m2, m3, _ = _momentos_centrales(n, *sumas)
     
-    if desviacion == 0:
+    if m2 == 0:
         return 0.0
     
-    suma_cubos = np.sum((numeros - media) ** 3)
-    asimetria = (suma_cubos / n) / (desviacion ** 3)
+    asimetria = m3 / m2 ** 1.5
     
     return asimetria
 
@@ -111,14 +210,14 @@ def calcular_curtosis(numeros: np.ndarray) -> float:
     if n < 4:
         return 0.0
     
-    media = np.mean(numeros)
-    desviacion = np.std(numeros)
+    # Momentos centrales a partir de sumas de potencias, sin temporales (x - media)**4
+    _, *sumas, _, _ = _momentos_un_paso(np.ascontiguousarray(numeros, dtype=np.float64))
+    _, m2, _, m4 = _momentos_centrales(n, *sumas)
     
-    if desviacion == 0:
+    if m2 == 0:
         return 0.0
     
-    suma_cuartos = np.sum((numeros - media) ** 4)
-    curtosis = (suma_cuartos / n) / (desviacion ** 4) - 3  # Excess kurtosis
+    curtosis = m4 / m2 ** 2 - 3  # Excess kurtosis
     
     return curtosis
 
@@ -133,17 +232,18 @@ def generar_histograma(numeros: List[float], bins: int = 10) -> Dict[str, Any]:
     Returns:
         Dict: Datos del histograma
     """
-    if not numeros:
+    if len(numeros) == 0:
         return {}
     
     hist, edges = np.histogram(numeros, bins=bins)
+    limites = edges.tolist()
     
     return {
         'frecuencias': hist.tolist(),
-        'bins_edges': edges.tolist(),
-        'bins_centers': [(edges[i] + edges[i+1]) / 2 for i in range(len(edges)-1)],
-        'bins_ranges': [f"{edges[i]:.3f}-{edges[i+1]:.3f}" for i in range(len(edges)-1)],
-        'ancho_bin': edges[1] - edges[0]
+        'bins_edges': limites,
+        'bins_centers': ((edges[:-1] + edges[1:]) * 0.5).tolist(),
+        'bins_ranges': [f"{inicio:.3f}-{fin:.3f}" for inicio, fin in zip(limites, limites[1:])],
+        'ancho_bin': float(edges[1] - edges[0])
     }
 
 def prueba_bondad_ajuste(numeros: List[float], distribucion: str = 'uniforme') -> Dict[str, Any]:
@@ -157,41 +257,38 @@ def prueba_bondad_ajuste(numeros: List[float], distribucion: str = 'uniforme') -
     Returns:
         Dict: Resultados de la prueba
     """
-    from scipy import stats
-    
-    try:
-        if distribucion == 'uniforme':
-            # Prueba chi-cuadrado para uniformidad
-            frec_obs, _ = np.histogram(numeros, bins=10)
-            frec_esp = np.full_like(frec_obs, len(numeros) / 10)
-            
-            chi2, p_value = stats.chisquare(frec_obs, frec_esp)
-            
-            return {
-                'estadistico_chi2': chi2,
-                'p_valor': p_value,
-                'distribucion': distribucion,
-                'ajuste_adecuado': p_value > 0.05,
-                'interpretacion': f"Los números se ajustan {'adecuadamente' if p_value > 0.05 else 'inadecuadamente'} a una distribución uniforme (p={p_value:.4f})"
-            }
-            
-        elif distribucion == 'normal':
-            # Prueba de normalidad Shapiro-Wilk
-            stat, p_value = stats.shapiro(numeros)
-            
-            return {
-                'estadistico_w': stat,
-                'p_valor': p_value,
-                'distribucion': distribucion,
-                'ajuste_adecuado': p_value > 0.05,
-                'interpretacion': f"Los números se ajustan {'adecuadamente' if p_value > 0.05 else 'inadecuadamente'} a una distribución normal (p={p_value:.4f})"
-            }
-            
-    except ImportError:
+    if not _SCIPY_DISPONIBLE:
         return {
             'error': 'Scipy no disponible para pruebas estadísticas',
             'interpretacion': 'No se pudo realizar la prueba de bondad de ajuste'
         }
+    
+    if distribucion == 'uniforme':
+        # Prueba chi-cuadrado para uniformidad
+        frec_obs, _ = np.histogram(numeros, bins=10)
+        frec_esp = np.full_like(frec_obs, len(numeros) / 10)
+        
+        chi2, p_value = _scipy_stats.chisquare(frec_obs, frec_esp)
+        
+        return {
+            'estadistico_chi2': chi2,
+            'p_valor': p_value,
+            'distribucion': distribucion,
+            'ajuste_adecuado': p_value > 0.05,
+            'interpretacion': f"Los números se ajustan {'adecuadamente' if p_value > 0.05 else 'inadecuadamente'} a una distribución uniforme (p={p_value:.4f})"
+        }
+        
+    elif distribucion == 'normal':
+        # Prueba de normalidad Shapiro-Wilk
+        stat, p_value = _scipy_stats.shapiro(numeros)
+        
+        return {
+            'estadistico_w': stat,
+            'p_valor': p_value,
+            'distribucion': distribucion,
+            'ajuste_adecuado': p_value > 0.05,
+            'interpretacion': f"Los números se ajustan {'adecuadamente' if p_value > 0.05 else 'inadecuadamente'} a una distribución normal (p={p_value:.4f})"
+        }
 
 def correlacion_serial(numeros: List[float], lag: int = 1) -> float:
     """
@@ -222,45 +319,42 @@ def prueba_aleatoriedad(numeros: List[float]) -> Dict[str, Any]:
     Returns:
         Dict: Resultados de la prueba
     """
-    try:
-        from statsmodels.sandbox.stats.runs import runstest_1samp
-        
-        # Convertir a secuencia de signos (arriba/abajo de la mediana)
-        mediana = np.median(numeros)
-        secuencia = [1 if x > mediana else 0 for x in numeros]
-        
-        # Contar rachas
-        rachas = 1
-        for i in range(1, len(secuencia)):
-            if secuencia[i] != secuencia[i-1]:
-                rachas += 1
-        
-        # Estadístico de rachas
-        n1 = sum(secuencia)  # Número de unos
-        n2 = len(secuencia) - n1  # Número de ceros
-        
-        media_rachas = (2 * n1 * n2) / (n1 + n2) + 1
-        varianza_rachas = (2 * n1 * n2 * (2 * n1 * n2 - n1 - n2)) / ((n1 + n2)**2 * (n1 + n2 - 1))
-        
-        if varianza_rachas == 0:
-            z = 0
-        else:
-            z = (rachas - media_rachas) / math.sqrt(varianza_rachas)
-        
-        # Valor p aproximado (dos colas)
-        from scipy import stats
-        p_value = 2 * (1 - stats.norm.cdf(abs(z)))
-        
+    if not _SCIPY_DISPONIBLE:
         return {
-            'numero_rachas': rachas,
-            'estadistico_z': z,
-            'p_valor': p_value,
-            'aleatorio': p_value > 0.05,
-            'interpretacion': f"La secuencia es {'aleatoria' if p_value > 0.05 else 'no aleatoria'} (p={p_value:.4f})"
-        }
-        
-    except ImportError:
-        return {
-            'error': 'Statsmodels no disponible para prueba de rachas',
+            'error': 'Scipy no disponible para prueba de rachas',
             'interpretacion': 'No se pudo realizar la prueba de aleatoriedad'
-        }
\ No newline at end of file
+        }
+    
+    # Convertir a secuencia de signos (arriba/abajo de la mediana)
+    array_np = np.asarray(numeros)
+    secuencia = array_np > np.median(array_np)
+    
+    # Contar rachas: una más que la cantidad de cambios de signo
+    rachas = int(np.count_nonzero(secuencia[1:] != secuencia[:-1])) + 1
+    
+    # Estadístico de rachas
+    n1 = int(np.count_nonzero(secuencia))  # Número de unos
+    n2 = secuencia.size - n1  # Número de ceros
+    
+    media_rachas = (2 * n1 * n2) / (n1 + n2) + 1
+    varianza_rachas = (2 * n1 * n2 * (2 * n1 * n2 - n1 - n2)) / ((n1 + n2)**2 * (n1 + n2 - 1))
+    
+    if varianza_rachas == 0:
+        z = 0
+    else:
+        z = (rachas - media_rachas) / math.sqrt(varianza_rachas)
+    
+    # Valor p aproximado (dos colas)
+    p_value = 2 * (1 - _scipy_stats.norm.cdf(abs(z)))
+    
+    return {
+        'numero_rachas': rachas,
+        'estadistico_z': z,
+        'p_valor': p_value,
+        'aleatorio': p_value > 0.05,
+        'interpretacion': f"La secuencia es {'aleatoria' if p_value > 0.05 else 'no aleatoria'} (p={p_value:.4f})"
+    }
+
+# Compilar los kernels al importar para que la primera petición no pague la compilación
+if NUMBA_DISPONIBLE:
+    _momentos_un_paso_kernel(np.zeros(1))
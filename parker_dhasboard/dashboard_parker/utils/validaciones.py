@@ -1,8 +1,65 @@
 import pandas as pd
 import numpy as np
 from typing import Dict, Any, List, Tuple
+import os
 import re
 
+# Extensiones aceptadas por defecto para archivos de datos
+_EXTENSIONES_PERMITIDAS = ('.csv', '.xlsx', '.xls', '.txt', '.json')
+
+# Tamaño máximo de archivo subido (16MB)
+_TAMANO_MAXIMO_ARCHIVO = 16 * 1024 * 1024
+
+# Caracteres no permitidos en nombres de archivo
+_CARACTERES_INSEGUROS = re.compile(r'[^\w\-_.]')
+
+def _validar_multiplicador(a, errores: List[str]) -> None:
+    """Multiplicador común a los generadores lineal y multiplicativo"""
+    if a is None:
+        errores.append("El multiplicador 'a' es requerido")
+    elif a <= 0:
+        errores.append("El multiplicador 'a' debe ser positivo")
+
+def _validar_lineal(parametros: Dict[str, Any], semilla, m, errores: List[str]) -> None:
+    """Parámetros propios del generador lineal"""
+    _validar_multiplicador(parametros.get('a'), errores)
+    
+    c = parametros.get('c')
+    if c is None:
+        errores.append("El incremento 'c' es requerido")
+    elif c < 0:
+        errores.append("El incremento 'c' debe ser no negativo")
+    
+    # Validar que m sea suficientemente grande
+    if m and semilla and m <= semilla:
+        errores.append("El módulo m debe ser mayor que la semilla")
+
+def _validar_multiplicativo(parametros: Dict[str, Any], semilla, m, errores: List[str]) -> None:
+    """Parámetros propios del generador multiplicativo"""
+    _validar_multiplicador(parametros.get('a'), errores)
+    
+    if m and semilla and m <= semilla:
+        errores.append("El módulo m debe ser mayor que la semilla")
+
+def _validar_cuadratico(parametros: Dict[str, Any], semilla, m, errores: List[str]) -> None:
+    """Parámetros propios del generador cuadrático"""
+    a = parametros.get('a')
+    if a is None or a == 0:
+        errores.append("El coeficiente cuadrático 'a' es requerido y no puede ser cero")
+    
+    if parametros.get('b') is None:
+        errores.append("El coeficiente lineal 'b' es requerido")
+    
+    if parametros.get('c_const') is None:
+        errores.append("El término constante 'c' es requerido")
+
+# Validaciones específicas por tipo de generador
+_VALIDADORES_GENERADOR = {
+    'lineal': _validar_lineal,
+    'multiplicativo': _validar_multiplicativo,
+    'cuadratico': _validar_cuadratico
+}
+
 def validar_parametros_congruencial(tipo: str, parametros: Dict[str, Any]) -> Tuple[bool, List[str]]:
     """
     Validar parámetros para generadores congruenciales
@@ -30,52 +87,11 @@ def validar_parametros_congruencial(tipo: str, parametros: Dict[str, Any]) -> Tu
         errores.append("El módulo m debe ser un número positivo")
     
     # Validaciones específicas por tipo
-    if tipo == 'lineal':
-        a = parametros.get('a')
-        c = parametros.get('c')
-        
-        if a is None:
-            errores.append("El multiplicador 'a' es requerido")
-        elif a <= 0:
-            errores.append("El multiplicador 'a' debe ser positivo")
-        
-        if c is None:
-            errores.append("El incremento 'c' es requerido")
-        elif c < 0:
-            errores.append("El incremento 'c' debe ser no negativo")
-        
-        # Validar que m sea suficientemente grande
-        if m and semilla and m <= semilla:
-            errores.append("El módulo m debe ser mayor que la semilla")
-    
-    elif tipo == 'multiplicativo':
-        a = parametros.get('a')
-        
-        if a is None:
-            errores.append("El multiplicador 'a' es requerido")
-        elif a <= 0:
-            errores.append("El multiplicador 'a' debe ser positivo")
-        
-        # Validaciones para generador multiplicativo
-        if m and semilla and m <= semilla:
-            errores.append("El módulo m debe ser mayor que la semilla")
-    
-    elif tipo == 'cuadratico':
-        a = parametros.get('a')
-        b = parametros.get('b')
-        c_const = parametros.get('c_const')
-        
-        if a is None or a == 0:
-            errores.append("El coeficiente cuadrático 'a' es requerido y no puede ser cero")
-        
-        if b is None:
-            errores.append("El coeficiente lineal 'b' es requerido")
-        
-        if c_const is None:
-            errores.append("El término constante 'c' es requerido")
-    
-    else:
+    validador = _VALIDADORES_GENERADOR.get(tipo)
+    if validador is None:
         errores.append(f"Tipo de generador no válido: {tipo}")
+    else:
+        validador(parametros, semilla, m, errores)
     
     return len(errores) == 0, errores
 
@@ -91,22 +107,27 @@ def validar_archivo_subido(archivo, extensiones_permitidas: List[str] = None) ->
         Tuple: (es_valido, mensaje_error)
     """
     if extensiones_permitidas is None:
-        extensiones_permitidas = ['.csv', '.xlsx', '.xls', '.txt', '.json']
+        extensiones_permitidas = _EXTENSIONES_PERMITIDAS
+    else:
+        extensiones_permitidas = tuple(extensiones_permitidas)
     
     if not archivo or archivo.filename == '':
         return False, "No se seleccionó ningún archivo"
     
     # Validar extensión
-    if not any(archivo.filename.lower().endswith(ext) for ext in extensiones_permitidas):
+    if not archivo.filename.lower().endswith(extensiones_permitidas):
         return False, f"Tipo de archivo no permitido. Extensiones válidas: {', '.join(extensiones_permitidas)}"
     
-    # Validar tamaño (16MB máximo)
-    if len(archivo.read()) > 16 * 1024 * 1024:
-        return False, "El archivo es demasiado grande (máximo 16MB)"
+    # Validar tamaño (16MB máximo) posicionándose al final, sin leer el contenido
+    archivo.seek(0, os.SEEK_END)
+    tamano = archivo.tell()
     
     # Regresar al inicio del archivo
     archivo.seek(0)
     
+    if tamano > _TAMANO_MAXIMO_ARCHIVO:
+        return False, "El archivo es demasiado grande (máximo 16MB)"
+    
     return True, "Archivo válido"
 
 def validar_dataframe(df: pd.DataFrame, columnas_requeridas: List[str] = None) -> Tuple[bool, List[str]]:
@@ -133,22 +154,24 @@ def validar_dataframe(df: pd.DataFrame, columnas_requeridas: List[str] = None) -
                 errores.append(f"Columna requerida no encontrada: {col}")
     
     # Validar que haya datos numéricos
-    if df.select_dtypes(include=[np.number]).empty:
+    if df.select_dtypes(include=[np.number]).shape[1] == 0:
         errores.append("No se encontraron columnas numéricas en el archivo")
     
     # Validar valores nulos
-    if df.isnull().any().any():
-        columnas_nulas = df.columns[df.isnull().any()].tolist()
+    columnas_con_nulos = df.isnull().any()
+    if columnas_con_nulos.any():
+        columnas_nulas = df.columns[columnas_con_nulos].tolist()
         errores.append(f"Se encontraron valores nulos en las columnas: {', '.join(columnas_nulas)}")
     
     return len(errores) == 0, errores
 
-def analizar_datos_archivo(datos) -> Dict[str, Any]:
+def analizar_datos_archivo(datos, deep: bool = False) -> Dict[str, Any]:
     """
     Analizar datos del archivo subido
     
     Args:
         datos: DataFrame o datos del archivo
+        deep (bool): Medir la memoria recorriendo cada objeto de las columnas object
     
     Returns:
         Dict: Análisis de los datos
@@ -164,20 +187,32 @@ def analizar_datos_archivo(datos) -> Dict[str, Any]:
         'columnas': list(df.columns),
         'tipos_datos': df.dtypes.astype(str).to_dict(),
         'valores_faltantes': df.isnull().sum().to_dict(),
-        'memoria_usada': df.memory_usage(deep=True).sum(),
+        'memoria_usada': int(df.memory_usage(deep=deep).sum()),
         'estadisticas': {}
     }
     
     # Estadísticas para columnas numéricas
-    columnas_numericas = df.select_dtypes(include=[np.number]).columns
-    if not columnas_numericas.empty:
-        analisis['estadisticas'] = df[columnas_numericas].describe().to_dict()
+    numericas = df.select_dtypes(include=[np.number])
+    if numericas.shape[1] > 0:
+        analisis['estadisticas'] = numericas.describe().to_dict()
     
     # Información de valores únicos
     analisis['valores_unicos'] = df.nunique().to_dict()
     
     return analisis
 
+def analizar_datos_archivo_deep(datos) -> Dict[str, Any]:
+    """
+    Analizar datos del archivo subido midiendo la memoria real de cada objeto
+    
+    Args:
+        datos: DataFrame o datos del archivo
+    
+    Returns:
+        Dict: Análisis de los datos
+    """
+    return analizar_datos_archivo(datos, deep=True)
+
 def sanitizar_nombre_archivo(nombre: str) -> str:
     """
     Sanitizar nombre de archivo para seguridad
@@ -188,14 +223,8 @@ def sanitizar_nombre_archivo(nombre: str) -> str:
     Returns:
         str: Nombre sanitizado
     """
-    # Remover caracteres peligrosos
-    nombre_seguro = re.sub(r'[^\w\-_.]', '', nombre)
-    
-    # Limitar longitud
-    if len(nombre_seguro) > 255:
-        nombre_seguro = nombre_seguro[:255]
-    
-    return nombre_seguro
+    # Remover caracteres peligrosos y limitar longitud
+    return _CARACTERES_INSEGUROS.sub('', nombre)[:255]
 
 def validar_rango_numerico(valor: Any, min_val: float = None, max_val: float = None) -> Tuple[bool, str]:
     """